@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     DOMAIN,
@@ -14,9 +17,18 @@ from .const import (
     CONF_SHARED_CODE,
     CONF_SHARE_URL,
     CONF_POLL_INTERVAL,
+    CONF_STALE_MINUTES,
+    CONF_COORD_PRECISION,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_COORD_PRECISION,
+    DEFAULT_STALE_MINUTES,
+    SERVICE_PROFILE,
+    ATTR_CYCLES,
+    DEFAULT_PROFILE_CYCLES,
 )
 from .coordinator import SizzappCoordinator
+from .image_cache import async_get_image_cache
+from .profiler import async_start_profiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,13 +36,38 @@ _LOGGER = logging.getLogger(__name__)
 _LEGACY_UID_PREFIX = f"{LEGACY_DOMAIN}_"      # "sizzapp_"
 _NEW_UID_PREFIX = f"{DOMAIN}_"                # "sizzapp_tracker_"
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async def _async_handle_profile(call: ServiceCall) -> None:
+        """Profiliert die nächsten N Poll-Zyklen (aller geladenen Instanzen zusammen)."""
+        if not hass.data.get(DOMAIN):
+            raise HomeAssistantError("No Sizzapp instance loaded")
+        async_start_profiler(hass, call.data[ATTR_CYCLES])
+
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, _async_handle_profile, schema=PROFILE_SCHEMA)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     shared_code: str = entry.data.get(CONF_SHARED_CODE, "")
     share_url: str | None = entry.data.get(CONF_SHARE_URL)
     poll_interval = entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+    stale_minutes = entry.options.get(CONF_STALE_MINUTES, DEFAULT_STALE_MINUTES)
+    coord_precision = entry.options.get(CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION)
 
-    coordinator = SizzappCoordinator(hass, shared_code, share_url, poll_interval)
+    coordinator = SizzappCoordinator(
+        hass, shared_code, share_url, poll_interval, stale_minutes, coord_precision
+    )
     await coordinator.async_config_entry_first_refresh()
 
     if coordinator.last_update_success is False:
@@ -43,6 +80,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Plattformen ihre Entitäten anlegen (sonst entstehen Duplikate).
     _async_migrate_legacy_registrations(hass, entry, coordinator.code_hint)
 
+    # Tracker-Bilder im Hintergrund lokal cachen (blockiert den Setup nie);
+    # neue/geänderte Bilder werden nach jedem Poll nachgeladen. Bis ein Bild
+    # im Cache liegt, zeigt entity_picture auf files.sizzapp.com.
+    image_cache = async_get_image_cache(hass)
+
+    @callback
+    def _async_schedule_prefetch() -> None:
+        entry.async_create_background_task(
+            hass,
+            image_cache.async_prefetch(entry.entry_id, _image_filenames(coordinator)),
+            f"{DOMAIN} image prefetch {entry.entry_id}",
+        )
+
+    _async_schedule_prefetch()
+    entry.async_on_unload(coordinator.async_add_listener(_async_schedule_prefetch))
+    entry.async_on_unload(lambda: image_cache.async_release(entry.entry_id))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Options-Änderungen sofort übernehmen (kein Neustart nötig)
@@ -51,6 +105,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _image_filenames(coordinator: SizzappCoordinator) -> list[str]:
+    return [
+        u["image_filename"]
+        for u in (coordinator.data or {}).values()
+        if u.get("image_filename")
+    ]
+
+
 def _async_migrate_legacy_registrations(
     hass: HomeAssistant, entry: ConfigEntry, code_hint: str
 ) -> None:
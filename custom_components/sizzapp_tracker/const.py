@@ -8,6 +8,12 @@ API_URL = "https://api.sizzapp.com/app/location_sharing/info"
 API_PARAM = "shared_code"
 IMAGE_BASE_URL = "https://files.sizzapp.com/units_small/"
 
+# Lokaler Bild-Cache (siehe image_cache.py)
+DATA_IMAGE_CACHE = f"{DOMAIN}_image_cache"
+SIGNAL_IMAGE_UPDATED = f"{DOMAIN}_image_updated"  # Argument: image_filename
+IMAGE_CACHE_MAX_BYTES = 20 * 1024 * 1024
+IMAGE_REVALIDATE_SECONDS = 24 * 60 * 60
+
 CONF_SHARED_CODE = "shared_code"
 CONF_SHARE_URL = "share_url"
 CONF_POLL_INTERVAL = "poll_interval"
@@ -20,4 +26,9 @@ DEFAULT_SPEED_UNIT = "kmh"
 DEFAULT_COORD_PRECISION = 6
 DEFAULT_STALE_MINUTES = 5
 
+SERVICE_PROFILE = "profile"
+DATA_PROFILER = f"{DOMAIN}_profiler"
+ATTR_CYCLES = "cycles"
+DEFAULT_PROFILE_CYCLES = 3
+
 PLATFORMS = ["device_tracker", "sensor", "binary_sensor"]
@@ -4,12 +4,14 @@ from typing import Any
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.components.device_tracker.const import SourceType
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION, IMAGE_BASE_URL
+from .const import DOMAIN, CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION, SIGNAL_IMAGE_UPDATED
 from .coordinator import SizzappCoordinator
 from .entity import SizzappBaseEntity
+from .image_cache import SizzappImageCache, async_get_image_cache
 
 
 async def async_setup_entry(
@@ -18,11 +20,12 @@ async def async_setup_entry(
     coordinator: SizzappCoordinator = hass.data[DOMAIN][entry.entry_id]
     code_hint = coordinator.code_hint
     coord_precision = entry.options.get(CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION)
+    image_cache = async_get_image_cache(hass)
 
     entities: list[SizzappLocationTracker] = []
     for unit_id, data in (coordinator.data or {}).items():
         name = (data.get("name") or f"Unit {unit_id}").strip()
-        entities.append(SizzappLocationTracker(coordinator, unit_id, name, code_hint, coord_precision))
+        entities.append(SizzappLocationTracker(coordinator, unit_id, name, code_hint, coord_precision, image_cache))
 
     async_add_entities(entities)
 
@@ -34,15 +37,42 @@ class SizzappLocationTracker(SizzappBaseEntity, TrackerEntity):
     _attr_icon = "mdi:map-marker"
     _attr_source_type = SourceType.GPS
 
-    def __init__(self, coordinator: SizzappCoordinator, unit_id: int, name: str, code_hint: str, coord_precision: int) -> None:
+    def __init__(
+        self,
+        coordinator: SizzappCoordinator,
+        unit_id: int,
+        name: str,
+        code_hint: str,
+        coord_precision: int,
+        image_cache: SizzappImageCache,
+    ) -> None:
         super().__init__(coordinator, unit_id, name, code_hint)
         self._coord_precision = coord_precision
+        self._image_cache = image_cache
         self._attr_unique_id = f"sizzapp_tracker_{code_hint}_{unit_id}_location"
 
-        # Tracker-Bild als entity_picture
-        image_filename = (coordinator.data or {}).get(unit_id, {}).get("image_filename")
-        if image_filename:
-            self._attr_entity_picture = f"{IMAGE_BASE_URL}{image_filename}"
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_IMAGE_UPDATED, self._async_image_updated)
+        )
+
+    @callback
+    def _async_image_updated(self, image_filename: str) -> None:
+        if image_filename == self._image_filename:
+            self.async_write_ha_state()
+
+    @property
+    def _image_filename(self) -> str | None:
+        return (self.coordinator.data or {}).get(self._unit_id, {}).get("image_filename")
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Tracker-Bild aus dem lokalen Cache (Fallback: files.sizzapp.com)."""
+        image_filename = self._image_filename
+        if not image_filename:
+            return None
+        return self._image_cache.url_for(image_filename)
 
     def _round(self, val: float | None) -> float | None:
         if val is None:
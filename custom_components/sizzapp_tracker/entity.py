@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -29,3 +31,20 @@ class SizzappBaseEntity(CoordinatorEntity[SizzappCoordinator]):
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success and self._unit_id in (self.coordinator.data or {})
+
+
+class SizzappFleetEntity(CoordinatorEntity[SizzappCoordinator]):
+    """Basis für Flotten-Entitäten am Gerät des Config-Entries (Hub)."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer=MANUFACTURER,
+            name=f"{entry.title} Fleet",
+            entry_type=DeviceEntryType.SERVICE,
+            configuration_url="https://www.sizzapp.com",
+        )
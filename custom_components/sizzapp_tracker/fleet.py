@@ -0,0 +1,101 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+import math
+
+from homeassistant.components.zone import async_active_zone
+from homeassistant.core import HomeAssistant, callback
+
+
+@dataclass(frozen=True)
+class FleetSummary:
+    """Flotten-Kennzahlen eines Poll-Zyklus (Geschwindigkeit in km/h wie von der API)."""
+
+    units: int = 0
+    moving: int = 0
+    stale: int = 0
+    located: int = 0
+    avg_speed_kmh: float | None = None
+    centroid: tuple[float, float] | None = None
+    # (min_lat, min_lon, max_lat, max_lon)
+    bbox: tuple[float, float, float, float] | None = None
+    # zone entity_id -> Anzahl Einheiten
+    zones: dict[str, int] = field(default_factory=dict)
+
+
+def _float(val: Any) -> float | None:
+    """Endliche Zahl oder None (auch für "NaN"/"inf" aus der API)."""
+    if val is None:
+        return None
+    try:
+        f = float(val)
+    except (TypeError, ValueError):
+        return None
+    return f if math.isfinite(f) else None
+
+
+@callback
+def async_compute_fleet_summary(
+    hass: HomeAssistant,
+    units: Dict[int, Dict[str, Any]],
+    stale_minutes: int,
+    coord_precision: int,
+) -> FleetSummary:
+    """Berechnet alle Flotten-Kennzahlen in einem Durchlauf über die Einheiten.
+
+    Feld-Fallbacks und Koordinaten-Rundung entsprechen denen der
+    Einzel-Entitäten, damit die Summen zu deren States passen (HA bestimmt die
+    Zone eines Trackers aus dessen gerundeten Koordinaten).
+    """
+    precision = int(coord_precision)
+    now = datetime.now(timezone.utc)
+    stale_after = timedelta(minutes=stale_minutes)
+
+    moving = stale = 0
+    speeds: list[float] = []
+    lats: list[float] = []
+    lons: list[float] = []
+    zones: dict[str, int] = {}
+
+    for u in units.values():
+        if u.get("in_trip"):
+            moving += 1
+
+        raw = u.get("dt_unit") or u.get("ts") or u.get("timestamp")
+        if raw is not None:
+            try:
+                if now - datetime.fromisoformat(raw.replace("Z", "+00:00")) > stale_after:
+                    stale += 1
+            except (AttributeError, TypeError, ValueError):
+                pass
+
+        spd = _float(u.get("speed"))
+        if spd is not None:
+            speeds.append(spd)
+
+        lat = _float(u.get("lat") or u.get("latitude"))
+        lon = _float(u.get("lon") or u.get("lng") or u.get("longitude"))
+        if lat is None or lon is None:
+            continue
+        lat = round(lat, precision)
+        lon = round(lon, precision)
+        lats.append(lat)
+        lons.append(lon)
+
+        acc = _float(u.get("accuracy") or u.get("hdop") or u.get("radius")) or 0
+        zone = async_active_zone(hass, lat, lon, max(0, int(round(acc))))
+        if zone is not None:
+            zones[zone.entity_id] = zones.get(zone.entity_id, 0) + 1
+
+    located = len(lats)
+    return FleetSummary(
+        units=len(units),
+        moving=moving,
+        stale=stale,
+        located=located,
+        avg_speed_kmh=sum(speeds) / len(speeds) if speeds else None,
+        centroid=(sum(lats) / located, sum(lons) / located) if located else None,
+        bbox=(min(lats), min(lons), max(lats), max(lons)) if located else None,
+        zones=zones,
+    )
@@ -0,0 +1,285 @@
+from __future__ import annotations
+from http import HTTPStatus
+from typing import Any, Iterable
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+
+from aiohttp import ClientError, hdrs, web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    DATA_IMAGE_CACHE,
+    IMAGE_BASE_URL,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_REVALIDATE_SECONDS,
+    SIGNAL_IMAGE_UPDATED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_VERSION = 1
+_STORAGE_KEY = f"{DOMAIN}.image_cache"
+_SAVE_DELAY = 30
+
+# Dateinamen sind Content-Hashes -> Browser dürfen unbegrenzt cachen.
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_SUFFIX_RE = re.compile(r"^\.[a-z0-9]{1,5}$")
+_NAME_RE = re.compile(r"^[0-9a-f]{32}(\.[a-z0-9]{1,5})?$")
+
+
+def _suffix(image_filename: str) -> str:
+    ext = os.path.splitext(image_filename)[1].lower()
+    return ext if _SUFFIX_RE.match(ext) else ""
+
+
+@callback
+def async_get_image_cache(hass: HomeAssistant) -> SizzappImageCache:
+    """Gemeinsamer Bild-Cache aller Config-Entries (View wird nur einmal registriert)."""
+    cache: SizzappImageCache | None = hass.data.get(DATA_IMAGE_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_IMAGE_CACHE] = SizzappImageCache(hass)
+        hass.http.register_view(SizzappImageView(cache))
+    return cache
+
+
+class SizzappImageCache:
+    """Lädt Tracker-Bilder einmalig von files.sizzapp.com und hält sie lokal vor.
+
+    Dateien werden unter ihrem Content-Hash abgelegt, per ETag/Last-Modified
+    revalidiert und bei Überschreiten von IMAGE_CACHE_MAX_BYTES nach LRU
+    verdrängt – aber nur Bilder, die kein Tracker mehr verwendet. Der Index
+    (image_filename -> Metadaten) liegt in .storage.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._dir = hass.config.path(".cache", DOMAIN)
+        self._store: Store[dict[str, Any]] = Store(hass, _STORAGE_VERSION, _STORAGE_KEY)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load_task: asyncio.Task[None] | None = None
+        self._inflight: dict[str, asyncio.Task[None]] = {}
+        # entry_id -> image_filenames, die dessen Tracker aktuell verwenden
+        self._in_use: dict[str, set[str]] = {}
+
+    @callback
+    def url_for(self, image_filename: str) -> str:
+        """Lokale URL, falls gecacht – sonst die Original-URL bei Sizzapp."""
+        meta = self._entries.get(image_filename)
+        if meta is None:
+            return f"{IMAGE_BASE_URL}{image_filename}"
+        return f"/api/{DOMAIN}/image/{meta['name']}"
+
+    @callback
+    def async_resolve(self, name: str) -> str | None:
+        """Pfad zu einer gecachten Datei (und LRU-Zeitstempel aktualisieren)."""
+        if not _NAME_RE.match(name):
+            return None
+        found = False
+        now = time.time()
+        for meta in self._entries.values():
+            if meta["name"] == name:
+                meta["last_access"] = now
+                found = True
+        if not found:
+            return None
+        self._schedule_save()
+        return os.path.join(self._dir, name)
+
+    @callback
+    def async_release(self, entry_id: str) -> None:
+        """Bilder eines entladenen Config-Entries dürfen wieder verdrängt werden."""
+        self._in_use.pop(entry_id, None)
+
+    async def async_prefetch(self, entry_id: str, image_filenames: Iterable[str]) -> None:
+        """Lädt fehlende bzw. abgelaufene Bilder (parallel, ohne Doppel-Requests).
+
+        Die übergebenen Bilder gelten als von diesem Entry verwendet und werden
+        nicht verdrängt, solange er sie meldet.
+        """
+        wanted = set(image_filenames)
+        self._in_use[entry_id] = wanted
+        await self._async_ensure_loaded()
+        tasks: list[asyncio.Task[None]] = []
+        for image_filename in wanted:
+            task = self._inflight.get(image_filename)
+            if task is None:
+                task = self.hass.async_create_task(self._async_fetch(image_filename))
+                self._inflight[image_filename] = task
+                task.add_done_callback(
+                    lambda _t, f=image_filename: self._inflight.pop(f, None)
+                )
+            tasks.append(task)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _async_ensure_loaded(self) -> None:
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load())
+        try:
+            await self._load_task
+        except Exception:
+            # Fehlgeschlagenes Laden nicht cachen, beim nächsten Prefetch erneut versuchen
+            self._load_task = None
+            raise
+
+    async def _async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        on_disk = await self.hass.async_add_executor_job(self._scan_dir)
+        # Nur Einträge übernehmen, deren Datei noch existiert
+        self._entries = {
+            image_filename: meta
+            for image_filename, meta in (data.get("entries") or {}).items()
+            if meta.get("name") in on_disk
+        }
+        orphans = on_disk - {meta["name"] for meta in self._entries.values()}
+        if orphans:
+            await self.hass.async_add_executor_job(self._remove_files, orphans)
+
+    async def _async_fetch(self, image_filename: str) -> None:
+        meta = self._entries.get(image_filename)
+        if meta is not None and time.time() - meta.get("checked", 0) < IMAGE_REVALIDATE_SECONDS:
+            return
+
+        headers: dict[str, str] = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers[hdrs.IF_NONE_MATCH] = meta["etag"]
+            if meta.get("last_modified"):
+                headers[hdrs.IF_MODIFIED_SINCE] = meta["last_modified"]
+
+        session = async_get_clientsession(self.hass)
+        try:
+            async with session.get(f"{IMAGE_BASE_URL}{image_filename}", headers=headers, timeout=10) as resp:
+                if resp.status == HTTPStatus.NOT_MODIFIED and meta is not None:
+                    meta["checked"] = time.time()
+                    self._schedule_save()
+                    return
+                resp.raise_for_status()
+                body = await resp.read()
+                etag = resp.headers.get(hdrs.ETAG)
+                last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
+        except (ClientError, asyncio.TimeoutError) as err:
+            # Vorhandene (ggf. veraltete) Kopie bleibt in Gebrauch
+            _LOGGER.debug("Could not fetch Sizzapp image %s: %s", image_filename, err)
+            return
+
+        name = f"{hashlib.sha256(body).hexdigest()[:32]}{_suffix(image_filename)}"
+        if not self._is_referenced(name):
+            try:
+                await self.hass.async_add_executor_job(self._write_file, name, body)
+            except OSError as err:
+                _LOGGER.warning("Could not store Sizzapp image %s: %s", image_filename, err)
+                return
+
+        old_name = meta["name"] if meta is not None else None
+        now = time.time()
+        self._entries[image_filename] = {
+            "name": name,
+            "size": len(body),
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked": now,
+            "last_access": meta.get("last_access", now) if meta is not None else now,
+        }
+        if old_name and old_name != name and not self._is_referenced(old_name):
+            await self.hass.async_add_executor_job(self._remove_files, {old_name})
+
+        await self._async_evict()
+        self._schedule_save()
+
+        # URL hat sich geändert (neu gecacht oder neuer Inhalt) -> Tracker sofort
+        # neu schreiben statt bis zum nächsten Poll die alte URL zu zeigen
+        if name != old_name:
+            async_dispatcher_send(self.hass, SIGNAL_IMAGE_UPDATED, image_filename)
+
+    async def _async_evict(self) -> None:
+        """Verdrängt die am längsten nicht ausgelieferten, ungenutzten Bilder bis unter das Limit.
+
+        Von Trackern verwendete Bilder bleiben immer erhalten – sonst würde der
+        nächste Poll sie erneut laden und ein anderes verdrängen. Übersteigen
+        allein diese das Limit, bleibt der Cache entsprechend größer.
+        """
+        sizes = {meta["name"]: meta["size"] for meta in self._entries.values()}
+        total = sum(sizes.values())
+        if total <= IMAGE_CACHE_MAX_BYTES:
+            return
+
+        in_use = set().union(*self._in_use.values())
+        candidates = [item for item in self._entries.items() if item[0] not in in_use]
+        candidates.sort(key=lambda item: item[1].get("last_access", 0))
+
+        removed: set[str] = set()
+        for image_filename, meta in candidates:
+            if total <= IMAGE_CACHE_MAX_BYTES:
+                break
+            del self._entries[image_filename]
+            name = meta["name"]
+            if name not in removed and not self._is_referenced(name):
+                removed.add(name)
+                total -= sizes[name]
+        if removed:
+            _LOGGER.debug("Evicting %d Sizzapp image(s) from cache", len(removed))
+            await self.hass.async_add_executor_job(self._remove_files, removed)
+
+    def _is_referenced(self, name: str) -> bool:
+        return any(meta["name"] == name for meta in self._entries.values())
+
+    @callback
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"entries": self._entries}, _SAVE_DELAY)
+
+    def _scan_dir(self) -> set[str]:
+        try:
+            return {name for name in os.listdir(self._dir) if _NAME_RE.match(name)}
+        except FileNotFoundError:
+            return set()
+        except OSError as err:
+            _LOGGER.warning("Could not read Sizzapp image cache %s: %s", self._dir, err)
+            return set()
+
+    def _write_file(self, name: str, body: bytes) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        path = os.path.join(self._dir, name)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(body)
+        os.replace(tmp, path)
+
+    def _remove_files(self, names: Iterable[str]) -> None:
+        for name in names:
+            try:
+                os.remove(os.path.join(self._dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                _LOGGER.debug("Could not remove cached Sizzapp image %s: %s", name, err)
+
+
+class SizzappImageView(HomeAssistantView):
+    """Liefert gecachte Tracker-Bilder mit langen Cache-Headern aus.
+
+    Ohne Auth, da <img>-Tags keinen Token mitsenden; ausgeliefert werden nur
+    Dateien aus dem Cache-Index (öffentliche Sizzapp-Bilder), kein freier Proxy.
+    """
+
+    url = f"/api/{DOMAIN}/image/{{name}}"
+    name = f"api:{DOMAIN}:image"
+    requires_auth = False
+
+    def __init__(self, cache: SizzappImageCache) -> None:
+        self._cache = cache
+
+    async def get(self, request: web.Request, name: str) -> web.StreamResponse:
+        path = self._cache.async_resolve(name)
+        if path is None:
+            raise web.HTTPNotFound()
+        return web.FileResponse(path, headers={hdrs.CACHE_CONTROL: _CACHE_CONTROL})
@@ -0,0 +1,173 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Callable, TypeVar
+import cProfile
+import io
+import logging
+import pstats
+import sys
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, DATA_PROFILER
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Anzahl der Funktionen in der Zusammenfassung (je Sortierung)
+_SUMMARY_LIMIT = 30
+
+# Ab Python 3.12 basiert cProfile auf sys.monitoring und ist interpreterweit:
+# der Haupt-Profiler erfasst Executor-Threads mit, ein zweiter ist nicht erlaubt.
+_PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class SizzappProfiler:
+    """Ein cProfile für alle Instanzen über die nächsten N Coordinator-Zyklen.
+
+    Ein Zyklus reicht vom Beginn von _async_update_data bis nach
+    async_update_listeners, umfasst also Fetch, Decode, Mapping und die
+    async_write_ha_state-Aufrufe der Entitäten. Zyklen mehrerer Instanzen
+    dürfen sich überlappen: der Profiler ist aktiv, solange mindestens einer
+    läuft, und zählt alle gemeinsam gegen N. Während der Netzwerk-Wartezeit
+    läuft der Event-Loop weiter – dort erfasste fremde Tasks tauchen ebenfalls
+    in den Stats auf. Executor-Jobs laufen über run(): bis Python 3.11 unter
+    einem eigenen Profiler (beim Schreiben zusammengeführt), ab 3.12 erfasst
+    sie der Haupt-Profiler ohnehin.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        self._profile = cProfile.Profile()
+        self._executor_profiles: list[cProfile.Profile] = []
+        self._remaining = cycles
+        self._active = 0
+        self.cycles = cycles
+
+    @property
+    def recorded(self) -> int:
+        """Anzahl bereits abgeschlossener Zyklen."""
+        return self.cycles - self._remaining
+
+    def start_cycle(self) -> bool:
+        """Startet einen Zyklus; False, wenn bereits N Zyklen begonnen haben.
+
+        Wirft ValueError, wenn ein fremdes Profiling-Tool aktiv ist (ab 3.12).
+        """
+        if self._remaining - self._active <= 0:
+            return False
+        if self._active == 0:
+            self._profile.enable()
+        self._active += 1
+        return True
+
+    def end_cycle(self) -> bool:
+        """Beendet einen gestarteten Zyklus; True, wenn alle N Zyklen erfasst sind."""
+        self._active -= 1
+        self._remaining -= 1
+        if self._active == 0:
+            self._profile.disable()
+        return self._remaining <= 0 and self._active == 0
+
+    def run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Führt func im Executor-Thread aus (bis 3.11 unter eigenem Profiler).
+
+        Profiler-Fehler dürfen den Poll nie scheitern lassen – func läuft dann
+        einfach unprofiliert.
+        """
+        if _PROFILES_ALL_THREADS:
+            return func(*args)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            _LOGGER.debug("Executor profiling skipped: %s", err)
+            return func(*args)
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+            self._executor_profiles.append(profile)
+
+    def write(self, base_path: str) -> tuple[str, str] | None:
+        """Schreibt <base>.prof (pstats) und <base>.txt (Top-Funktionen).
+
+        Liefert None, wenn keiner der Profiler Daten erfasst hat.
+        """
+        stats: pstats.Stats | None = None
+        for profile in (self._profile, *self._executor_profiles):
+            profile.create_stats()
+            if not profile.stats:
+                # pstats kann leere Profile nicht laden
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is None:
+            return None
+
+        stats_path = f"{base_path}.prof"
+        summary_path = f"{base_path}.txt"
+        stats.dump_stats(stats_path)
+
+        out = io.StringIO()
+        out.write(f"Sizzapp profile over {self.cycles} coordinator cycle(s)\n\n")
+        for sort_key in ("cumulative", "tottime"):
+            out.write(f"=== Top {_SUMMARY_LIMIT} by {sort_key} ===\n")
+            stats.stream = out
+            stats.sort_stats(sort_key).print_stats(_SUMMARY_LIMIT)
+        with open(summary_path, "w", encoding="utf-8") as fh:
+            fh.write(out.getvalue())
+        return stats_path, summary_path
+
+
+@callback
+def async_start_profiler(hass: HomeAssistant, cycles: int) -> None:
+    """Startet das Profiling der nächsten `cycles` Poll-Zyklen aller Instanzen."""
+    if hass.data.get(DATA_PROFILER) is not None:
+        raise HomeAssistantError("Sizzapp profiling is already running")
+    hass.data[DATA_PROFILER] = SizzappProfiler(cycles)
+
+
+@callback
+def async_start_cycle(hass: HomeAssistant) -> SizzappProfiler | None:
+    """Profiler für einen beginnenden Poll-Zyklus, sonst None (kein Overhead)."""
+    profiler: SizzappProfiler | None = hass.data.get(DATA_PROFILER)
+    if profiler is None:
+        return None
+    try:
+        return profiler if profiler.start_cycle() else None
+    except ValueError as err:
+        # Fremder Profiler aktiv: abbrechen, bisher Erfasstes trotzdem schreiben
+        _LOGGER.warning("Sizzapp profiling aborted: %s", err)
+        hass.data.pop(DATA_PROFILER, None)
+        if profiler.recorded:
+            hass.async_create_task(async_write_profile(hass, profiler))
+        return None
+
+
+@callback
+def async_end_cycle(hass: HomeAssistant, profiler: SizzappProfiler) -> None:
+    """Beendet einen Zyklus; nach dem letzten werden die Ergebnisse geschrieben."""
+    if profiler.end_cycle():
+        if hass.data.get(DATA_PROFILER) is profiler:
+            hass.data.pop(DATA_PROFILER)
+        hass.async_create_task(async_write_profile(hass, profiler))
+
+
+async def async_write_profile(hass: HomeAssistant, profiler: SizzappProfiler) -> None:
+    """Schreibt die Ergebnisse ins Config-Verzeichnis (im Executor)."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    base_path = hass.config.path(f"{DOMAIN}_profile_{stamp}")
+    try:
+        paths = await hass.async_add_executor_job(profiler.write, base_path)
+    except OSError as err:
+        _LOGGER.error("Could not write Sizzapp profile: %s", err)
+        return
+    if paths is None:
+        _LOGGER.warning("Sizzapp profiling recorded no data, nothing written")
+        return
+    stats_path, summary_path = paths
+    _LOGGER.info("Sizzapp profile written to %s (summary: %s)", stats_path, summary_path)
@@ -6,11 +6,12 @@ from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, Sen
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.const import UnitOfSpeed
+from homeassistant.const import UnitOfLength, UnitOfSpeed
+from homeassistant.util.location import distance
 
 from .const import DOMAIN, CONF_SPEED_UNIT, DEFAULT_SPEED_UNIT
 from .coordinator import SizzappCoordinator
-from .entity import SizzappBaseEntity
+from .entity import SizzappBaseEntity, SizzappFleetEntity
 
 
 def _kmh_to_mph(v: float) -> float:
@@ -28,6 +29,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         entities.append(SizzappSpeedSensor(coordinator, unit_id, name, speed_unit, code_hint))
         entities.append(SizzappHeadingSensor(coordinator, unit_id, name, code_hint))
         entities.append(SizzappLastUpdateSensor(coordinator, unit_id, name, code_hint))
+
+    # Flotten-Kennzahlen am Hub-Gerät (berechnet einmal pro Poll im Coordinator)
+    entities.append(SizzappFleetMovingSensor(coordinator, entry, code_hint))
+    entities.append(SizzappFleetStaleSensor(coordinator, entry, code_hint))
+    entities.append(SizzappFleetSpeedSensor(coordinator, entry, speed_unit, code_hint))
+    entities.append(SizzappFleetZonesSensor(coordinator, entry, code_hint))
+    entities.append(SizzappFleetExtentSensor(coordinator, entry, code_hint))
     async_add_entities(entities)
 
 
@@ -99,3 +107,118 @@ class SizzappLastUpdateSensor(SizzappBaseEntity, SensorEntity):
             return dt.astimezone(timezone.utc)
         except (TypeError, ValueError):
             return None
+
+
+class SizzappFleetMovingSensor(SizzappFleetEntity, SensorEntity):
+    _attr_name = "Units Moving"
+    _attr_icon = "mdi:car-multiple"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry, code_hint: str) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"sizzapp_tracker_{code_hint}_fleet_moving"
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.fleet.moving
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {"units": self.coordinator.fleet.units}
+
+
+class SizzappFleetStaleSensor(SizzappFleetEntity, SensorEntity):
+    _attr_name = "Units Stale"
+    _attr_icon = "mdi:clock-alert-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry, code_hint: str) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"sizzapp_tracker_{code_hint}_fleet_stale"
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.fleet.stale
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {"units": self.coordinator.fleet.units}
+
+
+class SizzappFleetSpeedSensor(SizzappFleetEntity, SensorEntity):
+    _attr_name = "Average Speed"
+    _attr_device_class = SensorDeviceClass.SPEED
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry, speed_unit: str, code_hint: str) -> None:
+        super().__init__(coordinator, entry)
+        self._speed_unit = speed_unit
+        self._attr_unique_id = f"sizzapp_tracker_{code_hint}_fleet_avg_speed"
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        return UnitOfSpeed.MILES_PER_HOUR if self._speed_unit == "mph" else UnitOfSpeed.KILOMETERS_PER_HOUR
+
+    @property
+    def native_value(self) -> float | None:
+        v = self.coordinator.fleet.avg_speed_kmh
+        if v is None:
+            return None
+        return round(_kmh_to_mph(v), 1) if self._speed_unit == "mph" else round(v, 1)
+
+
+class SizzappFleetZonesSensor(SizzappFleetEntity, SensorEntity):
+    """Anzahl der Einheiten in einer Zone, aufgeschlüsselt je Zone als Attribute."""
+
+    _attr_name = "Units in Zones"
+    _attr_icon = "mdi:map-marker-radius"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry, code_hint: str) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"sizzapp_tracker_{code_hint}_fleet_in_zones"
+
+    @property
+    def native_value(self) -> int:
+        return sum(self.coordinator.fleet.zones.values())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return dict(self.coordinator.fleet.zones)
+
+
+class SizzappFleetExtentSensor(SizzappFleetEntity, SensorEntity):
+    """Diagonale der Bounding Box aller Einheiten; Mittelpunkt und Box als Attribute."""
+
+    _attr_name = "Fleet Extent"
+    _attr_icon = "mdi:vector-square"
+    _attr_device_class = SensorDeviceClass.DISTANCE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
+
+    def __init__(self, coordinator: SizzappCoordinator, entry: ConfigEntry, code_hint: str) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"sizzapp_tracker_{code_hint}_fleet_extent"
+
+    @property
+    def native_value(self) -> float | None:
+        bbox = self.coordinator.fleet.bbox
+        if bbox is None:
+            return None
+        meters = distance(bbox[0], bbox[1], bbox[2], bbox[3])
+        return round(meters / 1000, 2) if meters is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        fleet = self.coordinator.fleet
+        if fleet.centroid is None or fleet.bbox is None:
+            return {"located_units": 0}
+        return {
+            "located_units": fleet.located,
+            "centroid_latitude": fleet.centroid[0],
+            "centroid_longitude": fleet.centroid[1],
+            "min_latitude": fleet.bbox[0],
+            "min_longitude": fleet.bbox[1],
+            "max_latitude": fleet.bbox[2],
+            "max_longitude": fleet.bbox[3],
+        }